@@ -1,77 +1,421 @@
 import argparse
 import asyncio
+import codecs
+import contextlib
+import hashlib
 import json
+import mmap
+import multiprocessing
+import os
+import re
+import shutil
 import tempfile
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, Optional
 
+import ijson
+import orjson
 from aiohttp import web
 
 FRONTEND_DIR = Path(__file__).resolve().parents[1] / "frontend"
+DEFAULT_CACHE_TTL = 86400.0
+DEFAULT_META_CACHE_ENTRIES = 32
+DEFAULT_TEXT_CACHE_ENTRIES = 256
+DEFAULT_DISK_CACHE_ENTRIES = 1024
+JSON3_STREAM_THRESHOLD = 256 * 1024
+VTT_STREAM_THRESHOLD = 4 * 1024 * 1024
+SSE_BATCH_WINDOW = 0.02
+SSE_BATCH_SIZE = 32
+DEFAULT_MAX_CONCURRENCY = min(4, os.cpu_count() or 1)
+CJK_LANGUAGE_PREFIXES = frozenset({"ja", "ko", "zh"})
+STREAM_CHUNK_SIZE = 8192
+EVENT_QUEUE_SIZE = 256
+DEFAULT_JOBS_TTL = 300.0
+TEXT_CHUNK_SIZE = 64 * 1024
+JOB_REAP_MIN_INTERVAL = 1.0
+MAX_REQUEST_BODY_SIZE = 4096
+MAX_WATCH_ID_LENGTH = 2048
+
+VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}\Z")
+WATCH_URL_ID_RE = re.compile(
+    r"(?:youtube\.com/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/|live/)|youtu\.be/)"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+
+ERR_BODY_TOO_LARGE = orjson.dumps({"message": "Request body is too large."})
+ERR_INVALID_JSON = orjson.dumps({"message": "Invalid JSON payload."})
+ERR_WATCH_ID_REQUIRED = orjson.dumps({"message": "Watch ID is required."})
+ERR_WATCH_ID_TOO_LONG = orjson.dumps({"message": "Watch ID is too long."})
+ERR_INVALID_LANGUAGE = orjson.dumps({"message": "Invalid preferred language."})
+ERR_RESULT_NOT_AVAILABLE = orjson.dumps({"type": "error", "message": "Result not available."})
+ERR_TEXT_NOT_AVAILABLE = orjson.dumps({"type": "error", "message": "Text not available."})
+PROCESSING_STATUS = orjson.dumps({"status": "processing"})
+
+LANGUAGE_CODE_RE = re.compile(r"[A-Za-z0-9_-]{1,35}\Z")
+VTT_BLOCK_SEP_RE = re.compile(rb"\n[ \t]*\n")
 
 
 @dataclass
 class JobState:
     watch_id: str
-    events: asyncio.Queue[dict[str, Any]] = field(default_factory=asyncio.Queue)
+    events: asyncio.Queue[dict[str, Any]] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    )
     done: asyncio.Event = field(default_factory=asyncio.Event)
     result: Optional[dict[str, Any]] = None
+    text: Optional[str] = None
     error: Optional[str] = None
+    completed_at: Optional[float] = None
+    dropped_logs: int = 0
+
+    def publish(self, event: dict[str, Any]) -> None:
+        if event["event"] != "log":
+            while self.events.full():
+                self.events.get_nowait()
+            self.events.put_nowait(event)
+            return
+        if self.events.qsize() >= self.events.maxsize - 1:
+            self.dropped_logs += len(event["data"].get("lines", ())) or 1
+            return
+        if self.dropped_logs:
+            message = f"Skipped {self.dropped_logs} log lines while the client was not reading."
+            self.events.put_nowait({"event": "log", "data": {"message": message}})
+            self.dropped_logs = 0
+        self.events.put_nowait(event)
 
 
+@dataclass
+class TTLCache:
+    ttl: float
+    max_entries: int
+    entries: OrderedDict[Hashable, tuple[float, Any]] = field(default_factory=OrderedDict)
+    pending: dict[Hashable, asyncio.Future] = field(default_factory=dict)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _) in self.entries.items() if expires_at < now]
+        for k in expired:
+            del self.entries[k]
+        self.entries[key] = (now + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            value = self.get(key)
+            if value is not None:
+                return value
+            pending = self.pending.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+        future = asyncio.get_running_loop().create_future()
+        self.pending[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()
+            raise
+        finally:
+            del self.pending[key]
+        self.set(key, value)
+        future.set_result(value)
+        return value
+
+
+@dataclass
+class DiskCache:
+    directory: Path
+    ttl: float
+    max_entries: int
 
+    def path_for(self, url: str) -> Path:
+        key = extract_video_id(url) or hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self.path_for(url)
+        try:
+            if self.ttl <= 0 or time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            entry = orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if not isinstance(entry, dict) or not entry.get("language") or not entry.get("text"):
+            return None
+        return entry
+
+    def set(self, url: str, entry: Dict[str, Any]) -> None:
+        if self.ttl <= 0:
+            return
+        path = self.path_for(url)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(orjson.dumps(entry))
+            os.replace(tmp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+        self.prune()
+
+    def prune(self) -> None:
+        cutoff = time.time() - self.ttl
+        entries: list[tuple[float, str]] = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith((".json", ".tmp")):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime < cutoff:
+                    with contextlib.suppress(OSError):
+                        os.unlink(entry.path)
+                elif entry.name.endswith(".json"):
+                    entries.append((mtime, entry.path))
+        entries.sort()
+        for _, path in entries[: max(len(entries) - self.max_entries, 0)]:
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+
+
+
+def extract_video_id(value: str) -> Optional[str]:
+    if len(value) == 11 and VIDEO_ID_RE.match(value):
+        return value
+    if "youtu" not in value:
+        return None
+    match = WATCH_URL_ID_RE.search(value)
+    return match.group(1) if match else None
+
+
+
+@lru_cache(maxsize=1024)
 def build_watch_url(watch_id: str) -> str:
-    if watch_id.startswith("http://") or watch_id.startswith("https://"):
+    video_id = extract_video_id(watch_id)
+    if video_id:
+        return f"https://www.youtube.com/watch?v={video_id}"
+    if watch_id.startswith(("http://", "https://")):
         return watch_id
     return f"https://www.youtube.com/watch?v={watch_id}"
 
 
 
-def pick_subtitle_language(info: Dict[str, Any]) -> tuple[Optional[str], bool]:
-    language = info.get("language")
+def pick_subtitle_language(
+    info: Dict[str, Any], preferred_language: Optional[str] = None
+) -> tuple[Optional[str], bool]:
     subtitles = info.get("subtitles") or {}
     auto_captions = info.get("automatic_captions") or {}
-    if language:
-        if language in subtitles:
-            return language, False
-        if language in auto_captions:
-            return language, True
+    for language in (preferred_language, info.get("language")):
+        if language:
+            if language in subtitles:
+                return language, False
+            if language in auto_captions:
+                return language, True
     if subtitles:
-        return sorted(subtitles.keys())[0], False
+        return min(subtitles), False
     if auto_captions:
-        return sorted(auto_captions.keys())[0], True
+        return min(auto_captions), True
     return None, False
 
 
-async def run_yt_dlp_json(url: str, cookies_path: Optional[Path]) -> Dict[str, Any]:
+async def stream_lines(
+    stream: asyncio.StreamReader,
+    on_lines: Callable[[list[str]], None],
+) -> None:
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    pending = ""
+    while True:
+        chunk = await stream.read(STREAM_CHUNK_SIZE)
+        text = pending + decoder.decode(chunk, final=not chunk)
+        lines = text.splitlines()
+        pending = ""
+        if chunk and lines and not text.endswith(("\n", "\r")):
+            pending = lines.pop()
+        lines = [line for line in lines if line]
+        if lines:
+            on_lines(lines)
+        if not chunk:
+            return
+
+
+def stderr_collector(
+    lines: list[str],
+    on_log: Optional[Callable[[list[str]], None]],
+) -> Callable[[list[str]], None]:
+    def on_stderr(chunk_lines: list[str]) -> None:
+        lines.extend(chunk_lines)
+        if on_log is not None:
+            warnings = [line for line in chunk_lines if not line.startswith("ERROR:")]
+            if warnings:
+                on_log(warnings)
+
+    return on_stderr
+
+
+def yt_dlp_error_message(lines: list[str], default: str) -> str:
+    errors = [line for line in lines if line.startswith("ERROR:")]
+    return "\n".join(errors or lines) or default
+
+
+async def run_yt_dlp_json(
+    url: str,
+    cookies_path: Optional[Path],
+    executor: Optional[Executor] = None,
+    on_log: Optional[Callable[[list[str]], None]] = None,
+) -> Dict[str, Any]:
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        logger = ytdlp_thread_logger(executor, on_log)
+        return await loop.run_in_executor(
+            executor, extract_info_in_worker, url, cookies_path, logger
+        )
+
     args = [
         "yt-dlp",
         "--dump-single-json",
-        "--no-warnings",
     ]
     if cookies_path:
         args.extend(["--cookies", str(cookies_path)])
     args.append(url)
 
-    process = await asyncio.create_subprocess_exec(
-        *args,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    stdout, stderr = await process.communicate()
-    if process.returncode != 0:
-        raise RuntimeError(stderr.decode("utf-8", errors="ignore") or "yt-dlp failed")
-    return json.loads(stdout.decode("utf-8"))
+    with tempfile.TemporaryFile() as out:
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=out,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        assert process.stderr is not None
+        stderr_lines: list[str] = []
+        await stream_lines(process.stderr, stderr_collector(stderr_lines, on_log))
+        await process.wait()
+        if process.returncode != 0:
+            raise RuntimeError(yt_dlp_error_message(stderr_lines, "yt-dlp failed"))
+        if os.fstat(out.fileno()).st_size == 0:
+            raise RuntimeError("yt-dlp returned no metadata")
+        return await asyncio.to_thread(load_json_file, out.fileno())
+
+
+def load_json_file(fileno: int) -> Dict[str, Any]:
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+        return orjson.loads(view)
+
+
+def read_json_file(path: Path) -> Dict[str, Any]:
+    return orjson.loads(path.read_bytes())
+
+
+def write_json_file(path: Path, data: Any) -> None:
+    path.write_bytes(orjson.dumps(data))
+
+
+def find_subtitle_file(out_dir: Path, language: str) -> Optional[Path]:
+    expected = out_dir / f"subtitle.{language}.json3"
+    if expected.is_file():
+        return expected
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("subtitle") and entry.name.endswith(".json3"):
+                return Path(entry.path)
+    return None
 
 
 async def run_yt_dlp_subtitles(
     url: str,
     language: str,
-    use_auto: bool,
+    use_auto: Optional[bool],
     out_dir: Path,
     cookies_path: Optional[Path],
+    info: Optional[Dict[str, Any]] = None,
+    executor: Optional[Executor] = None,
+    on_log: Optional[Callable[[list[str]], None]] = None,
+    on_info: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Path:
+    if executor is not None and info is not None and use_auto is not None:
+        loop = asyncio.get_running_loop()
+        logger = ytdlp_thread_logger(executor, on_log)
+
+        def download(info: Dict[str, Any]) -> Awaitable[Path]:
+            return loop.run_in_executor(
+                executor,
+                download_subtitles_in_worker,
+                info,
+                language,
+                use_auto,
+                out_dir,
+                cookies_path,
+                logger,
+            )
+
+        try:
+            return await download(info)
+        except (RuntimeError, FileNotFoundError):
+            info = await loop.run_in_executor(
+                executor, extract_info_in_worker, url, cookies_path, logger
+            )
+        if on_info is not None:
+            on_info(info)
+        return await download(info)
+    if info is None:
+        return await download_subtitle_file([url], language, use_auto, out_dir, cookies_path, on_log)
+    info_path = out_dir / "info.json"
+    await asyncio.to_thread(write_json_file, info_path, info)
+    try:
+        return await download_subtitle_file(
+            ["--load-info-json", str(info_path)],
+            language,
+            use_auto,
+            out_dir,
+            cookies_path,
+            on_log,
+        )
+    except (RuntimeError, FileNotFoundError):
+        pass
+    subtitle_path = await download_subtitle_file(
+        ["--write-info-json", url], language, use_auto, out_dir, cookies_path, on_log
+    )
+    fresh_info_path = out_dir / "subtitle.info.json"
+    if on_info is not None and fresh_info_path.is_file():
+        on_info(await asyncio.to_thread(read_json_file, fresh_info_path))
+    return subtitle_path
+
+
+async def download_subtitle_file(
+    source_args: list[str],
+    language: str,
+    use_auto: Optional[bool],
+    out_dir: Path,
+    cookies_path: Optional[Path],
+    on_log: Optional[Callable[[list[str]], None]] = None,
 ) -> Path:
     args = [
         "yt-dlp",
@@ -85,8 +429,10 @@ async def run_yt_dlp_subtitles(
     ]
     if cookies_path:
         args.extend(["--cookies", str(cookies_path)])
-    args.append(url)
-    if use_auto:
+    args.extend(source_args)
+    if use_auto is None:
+        args[2:2] = ["--write-sub", "--write-auto-subs"]
+    elif use_auto:
         args.insert(2, "--write-auto-subs")
     else:
         args.insert(2, "--write-sub")
@@ -96,63 +442,195 @@ async def run_yt_dlp_subtitles(
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
-    stdout, stderr = await process.communicate()
+    assert process.stdout is not None and process.stderr is not None
+    output: list[str] = []
+
+    def on_stdout(lines: list[str]) -> None:
+        output.extend(lines)
+        if on_log is not None:
+            on_log(lines)
+
+    stderr_lines: list[str] = []
+    try:
+        await asyncio.gather(
+            stream_lines(process.stdout, on_stdout),
+            stream_lines(process.stderr, stderr_collector(stderr_lines, on_log)),
+        )
+        await process.wait()
+    except asyncio.CancelledError:
+        if process.returncode is None:
+            process.kill()
+        raise
     if process.returncode != 0:
-        error = stderr.decode("utf-8", errors="ignore")
-        raise RuntimeError(error or "yt-dlp subtitle download failed")
+        raise RuntimeError(yt_dlp_error_message(stderr_lines, "yt-dlp subtitle download failed"))
 
-    for file in out_dir.glob("subtitle*.json3"):
-        return file
-    debug = stdout.decode("utf-8", errors="ignore")
+    subtitle_path = find_subtitle_file(out_dir, language)
+    if subtitle_path is not None:
+        return subtitle_path
+    debug = "\n".join(output)
     raise FileNotFoundError(f"Subtitle file not found. Output: {debug}")
 
 
 
+# yt-dlp hashes its logger (cached terminal checks), so keep identity hashing.
+@dataclass(eq=False)
+class YtDlpLogger:
+    loop: asyncio.AbstractEventLoop
+    on_log: Callable[[list[str]], None]
+
+    def debug(self, message: str) -> None:
+        if not message.startswith("[debug] "):
+            self.loop.call_soon_threadsafe(self.on_log, [message])
+
+    def info(self, message: str) -> None:
+        self.debug(message)
+
+    def warning(self, message: str) -> None:
+        self.loop.call_soon_threadsafe(self.on_log, [f"WARNING: {message}"])
+
+    def error(self, message: str) -> None:
+        pass
+
+
+def ytdlp_thread_logger(
+    executor: Executor,
+    on_log: Optional[Callable[[list[str]], None]],
+) -> Optional[YtDlpLogger]:
+    # Only in-process threads can report progress; a logger cannot be pickled to a worker process.
+    if on_log is None or not isinstance(executor, ThreadPoolExecutor):
+        return None
+    return YtDlpLogger(asyncio.get_running_loop(), on_log)
+
+
+def ytdlp_worker_options(
+    cookies_path: Optional[Path], logger: Optional[YtDlpLogger] = None
+) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "quiet": True,
+        "no_warnings": True,
+        "noprogress": True,
+        "skip_download": True,
+    }
+    if cookies_path:
+        options["cookiefile"] = str(cookies_path)
+    if logger is not None:
+        options["logger"] = logger
+    return options
+
+
+
+def warm_up_worker() -> None:
+    import yt_dlp  # noqa: F401
+
+
+
+def extract_info_in_worker(
+    url: str, cookies_path: Optional[Path], logger: Optional[YtDlpLogger] = None
+) -> Dict[str, Any]:
+    from yt_dlp import YoutubeDL
+
+    try:
+        with YoutubeDL(ytdlp_worker_options(cookies_path, logger)) as ydl:
+            return ydl.sanitize_info(ydl.extract_info(url, download=False))
+    except Exception as exc:  # noqa: BLE001
+        # yt-dlp errors carry tracebacks that cannot be pickled back to the server.
+        raise RuntimeError(str(exc)) from None
+
+
+
+def download_subtitles_in_worker(
+    info: Dict[str, Any],
+    language: str,
+    use_auto: bool,
+    out_dir: Path,
+    cookies_path: Optional[Path],
+    logger: Optional[YtDlpLogger] = None,
+) -> Path:
+    from yt_dlp import YoutubeDL
+
+    options = ytdlp_worker_options(cookies_path, logger)
+    options.update(
+        {
+            "writesubtitles": not use_auto,
+            "writeautomaticsub": use_auto,
+            "subtitleslangs": [language],
+            "subtitlesformat": "json3",
+            "outtmpl": str(out_dir / "subtitle.%(ext)s"),
+        }
+    )
+    try:
+        with YoutubeDL(options) as ydl:
+            ydl.process_ie_result(info, download=True)
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError(str(exc)) from None
+
+    subtitle_path = find_subtitle_file(out_dir, language)
+    if subtitle_path is not None:
+        return subtitle_path
+    raise FileNotFoundError("Subtitle file not found.")
+
+
+
 def is_cjk_language(language: Optional[str]) -> bool:
-    if not language:
-        return False
-    lowered = language.lower()
-    return lowered.startswith("ja") or lowered.startswith("ko") or lowered.startswith("zh")
+    return bool(language) and language[:2].lower() in CJK_LANGUAGE_PREFIXES
 
 
 
 def parse_vtt_text(path: Path, joiner: str) -> str:
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    cleaned: list[str] = []
-    skip_block = False
-    for raw in lines:
-        line = raw.strip("\ufeff").strip()
-        if not line:
-            continue
-        if line.startswith("WEBVTT"):
-            continue
-        if line.startswith("NOTE") or line.startswith("STYLE"):
-            skip_block = True
-            continue
-        if skip_block:
-            if line == "":
-                skip_block = False
-            continue
-        if "-->" in line:
+    if path.stat().st_size >= VTT_STREAM_THRESHOLD:
+        with path.open(encoding="utf-8", errors="ignore") as handle:
+            return joiner.join(iter_vtt_payload_lines(handle))
+    raw = path.read_bytes().removeprefix(b"\xef\xbb\xbf")
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    payloads: list[bytes] = []
+    for block in VTT_BLOCK_SEP_RE.split(raw):
+        timing = block.find(b"-->")
+        if timing == -1:
             continue
-        if line.isdigit():
+        payload = block.find(b"\n", timing)
+        if payload == -1:
             continue
-        cleaned.append(line)
-    return joiner.join(segment.strip() for segment in cleaned if segment.strip()).strip()
+        payloads.append(block[payload + 1 :])
+    text = b"\n".join(payloads).decode("utf-8", errors="ignore")
+    return joiner.join([line for line in map(str.strip, text.split("\n")) if line])
+
+
+
+def iter_vtt_payload_lines(lines: Iterable[str]) -> Iterator[str]:
+    in_payload = False
+    for line in lines:
+        line = line.strip()
+        if not line:
+            in_payload = False
+        elif in_payload:
+            yield line
+        elif "-->" in line:
+            in_payload = True
 
 
 
 def parse_json3_text(path: Path, joiner: str) -> str:
-    payload = json.loads(path.read_text(encoding="utf-8", errors="ignore"))
-    events = payload.get("events", [])
+    if path.stat().st_size < JSON3_STREAM_THRESHOLD:
+        payload = json.loads(path.read_text(encoding="utf-8", errors="ignore"))
+        return join_json3_events(payload.get("events", []), joiner)
+    with path.open("rb") as handle:
+        return join_json3_events(ijson.items(handle, "events.item"), joiner)
+
+
+
+def join_json3_events(events: Iterable[Dict[str, Any]], joiner: str) -> str:
     lines: list[str] = []
+    append = lines.append
     for event in events:
-        segments = event.get("segs") or []
-        text = "".join(segment.get("utf8", "") for segment in segments).strip()
-        if not text:
+        segments = event.get("segs")
+        if not segments:
             continue
-        lines.append(text.replace("\n", joiner).strip())
-    return joiner.join(lines).strip()
+        text = "".join([segment["utf8"] for segment in segments if "utf8" in segment])
+        text = text.replace("\n", joiner).strip()
+        if text:
+            append(text)
+    return joiner.join(lines)
 
 
 
@@ -173,90 +651,247 @@ def summarize_text(text: str, size: int = 400) -> Dict[str, str]:
     }
 
 
-async def process_download_job(app: web.Application, reservation_id: str) -> None:
-    jobs: dict[str, JobState] = app["jobs"]
-    job = jobs.get(reservation_id)
-    if job is None:
+async def process_download_job(
+    app: web.Application, url: str, preferred_language: Optional[str] = None
+) -> None:
+    inflight: dict[tuple[str, Optional[str]], dict[str, JobState]] = app["inflight"]
+    subscribers = inflight.get((url, preferred_language))
+    if not subscribers:
         return
 
-    async def push_event(event_type: str, payload: dict[str, Any]) -> None:
-        await job.events.put({"event": event_type, "data": payload})
-
-    async def send_log(message: str) -> None:
-        await push_event("log", {"message": message})
+    def push_event(event_type: str, payload: dict[str, Any]) -> None:
+        event = {"event": event_type, "data": payload}
+        for job in list(subscribers.values()):
+            job.publish(event)
 
-    try:
-        url = build_watch_url(job.watch_id)
-        await send_log(f"Fetching metadata for {url}...")
-        cookies_path = app.get("cookies_path")
-        info = await run_yt_dlp_json(url, cookies_path)
-
-        language, use_auto = pick_subtitle_language(info)
-        if not language:
-            raise RuntimeError("No subtitles available for this video.")
+    def send_log(message: str) -> None:
+        push_event("log", {"message": message})
 
-        await send_log(f"Selected language '{language}' ({'auto' if use_auto else 'manual'} captions).")
+    def send_log_lines(lines: list[str]) -> None:
+        push_event("log", {"lines": lines})
 
-        keep_temp = bool(app.get("keep_temp"))
-        temp_dir_obj: Optional[tempfile.TemporaryDirectory[str]] = None
-        if keep_temp:
-            out_dir = Path(tempfile.mkdtemp(prefix="yt_subtitle_"))
-            await send_log(f"Keeping temp files in {out_dir}.")
+    result: Optional[dict[str, Any]] = None
+    text: Optional[str] = None
+    error: Optional[str] = None
+    job_sem: asyncio.Semaphore = app["job_sem"]
+    slot_held = False
+
+    async def acquire_slot() -> None:
+        nonlocal slot_held
+        if slot_held:
+            return
+        if job_sem.locked():
+            push_event("queued", {"message": "Waiting for a free download slot..."})
+        await job_sem.acquire()
+        slot_held = True
+
+    disk_cache: Optional[DiskCache] = app["disk_cache"]
+    try:
+        cached = None
+        if disk_cache is not None:
+            cached = await asyncio.to_thread(disk_cache.get, url)
+        if cached is not None and preferred_language not in (None, cached["language"]):
+            cached = None
+        if cached is not None:
+            language = cached["language"]
+            text = cached["text"]
+            send_log(f"Using cached subtitle text from disk (language '{language}').")
         else:
-            temp_dir_obj = tempfile.TemporaryDirectory()
-            out_dir = Path(temp_dir_obj.name)
-
-        try:
-            await send_log("Downloading subtitles with yt-dlp...")
-            subtitle_path = await run_yt_dlp_subtitles(
-                url,
-                language,
-                use_auto,
-                out_dir,
-                cookies_path,
-            )
-
-            await send_log("Parsing subtitle text...")
-            text = parse_subtitle_text(subtitle_path, language)
-        finally:
-            if temp_dir_obj is not None:
-                temp_dir_obj.cleanup()
+            try:
+                language, text = await fetch_subtitle_text(
+                    app, url, preferred_language, acquire_slot, send_log, send_log_lines
+                )
+            finally:
+                if slot_held:
+                    job_sem.release()
+            if text and disk_cache is not None and preferred_language is None:
+                entry = {"language": language, "text": text}
+                await asyncio.to_thread(disk_cache.set, url, entry)
 
         if not text:
             raise RuntimeError("Subtitle text was empty.")
 
         summary = summarize_text(text)
-        job.result = {
+        result = {
             "type": "result",
             "language": language,
             "summary": summary,
-            "text": text,
         }
-        await send_log("Subtitle processing completed.")
-        await push_event("completed", {"reservation_id": reservation_id})
+        send_log("Subtitle processing completed.")
     except Exception as exc:  # noqa: BLE001
-        job.error = str(exc)
-        await push_event("error", {"message": job.error})
+        error = str(exc)
     finally:
-        job.done.set()
+        inflight.pop((url, preferred_language), None)
+        for reservation_id, job in subscribers.items():
+            job.result = result
+            job.text = text
+            job.error = error
+            job.completed_at = time.monotonic()
+            if error is not None:
+                job.publish({"event": "error", "data": {"message": error}})
+            elif result is not None:
+                job.publish({"event": "completed", "data": {"reservation_id": reservation_id}})
+            job.done.set()
+
+
+async def fetch_subtitle_text(
+    app: web.Application,
+    url: str,
+    preferred_language: Optional[str],
+    acquire_slot: Callable[[], Awaitable[None]],
+    send_log: Callable[[str], None],
+    send_log_lines: Callable[[list[str]], None],
+) -> tuple[str, str]:
+    cookies_path = app.get("cookies_path")
+    meta_cache: TTLCache = app["meta_cache"]
+    text_cache: TTLCache = app["text_cache"]
+
+    async def fetch_info() -> Dict[str, Any]:
+        await acquire_slot()
+        send_log(f"Fetching metadata for {url}...")
+        return await run_yt_dlp_json(url, cookies_path, app.get("ytdlp_pool"), send_log_lines)
+
+    speculative: Optional[asyncio.Task[str]] = None
+    if (
+        preferred_language
+        and app.get("ytdlp_pool") is None
+        and meta_cache.get(url) is None
+        and text_cache.get((url, preferred_language)) is None
+    ):
+        await acquire_slot()
+        send_log(f"Downloading '{preferred_language}' subtitles while fetching metadata...")
+        speculative = asyncio.create_task(
+            download_subtitle_text(
+                app, url, None, preferred_language, None, send_log, send_log_lines
+            )
+        )
+
+    try:
+        info = await meta_cache.get_or_fetch(url, fetch_info)
+
+        language, use_auto = pick_subtitle_language(info, preferred_language)
+        if not language:
+            raise RuntimeError("No subtitles available for this video.")
+
+        send_log(f"Selected language '{language}' ({'auto' if use_auto else 'manual'} captions).")
+
+        text = text_cache.get((url, language))
+        if text is not None:
+            send_log("Using cached subtitle text.")
+            return language, text
+        await acquire_slot()
+        if speculative is not None and language == preferred_language:
+            try:
+                text = await speculative
+            except Exception as exc:  # noqa: BLE001
+                send_log(f"Early subtitle download failed ({exc}); retrying.")
+        if not text:
+            text = await download_subtitle_text(
+                app, url, info, language, use_auto, send_log, send_log_lines
+            )
+        if text:
+            text_cache.set((url, language), text)
+        return language, text
+    finally:
+        if speculative is not None:
+            await discard_task(speculative)
+
+
+async def discard_task(task: asyncio.Task[Any]) -> None:
+    task.cancel()
+    await asyncio.wait([task])
+    if not task.cancelled():
+        task.exception()
+
+
+async def download_subtitle_text(
+    app: web.Application,
+    url: str,
+    info: Optional[Dict[str, Any]],
+    language: str,
+    use_auto: Optional[bool],
+    send_log: Callable[[str], None],
+    send_log_lines: Callable[[list[str]], None],
+) -> str:
+    cookies_path = app.get("cookies_path")
+    keep_temp = bool(app.get("keep_temp"))
+    if keep_temp:
+        out_dir = Path(tempfile.mkdtemp(prefix="yt_subtitle_"))
+        send_log(f"Keeping temp files in {out_dir}.")
+    else:
+        tmp_root: tempfile.TemporaryDirectory[str] = app["tmp_root"]
+        out_dir = Path(tmp_root.name) / uuid.uuid4().hex
+        out_dir.mkdir()
+
+    try:
+        send_log("Downloading subtitles with yt-dlp...")
+        subtitle_path = await run_yt_dlp_subtitles(
+            url,
+            language,
+            use_auto,
+            out_dir,
+            cookies_path,
+            info=info,
+            executor=app.get("ytdlp_pool"),
+            on_log=send_log_lines,
+            on_info=partial(app["meta_cache"].set, url),
+        )
+
+        send_log("Parsing subtitle text...")
+        text = await asyncio.to_thread(parse_subtitle_text, subtitle_path, language)
+    finally:
+        if not keep_temp:
+            await asyncio.to_thread(shutil.rmtree, out_dir, ignore_errors=True)
+    return text
+
+
+def json_response(data: Any, status: int = 200) -> web.Response:
+    body = data if isinstance(data, bytes) else orjson.dumps(data)
+    return web.Response(body=body, status=status, content_type="application/json", charset="utf-8")
 
 
 async def reservation_handler(request: web.Request) -> web.Response:
+    if request.content_length is not None and request.content_length > MAX_REQUEST_BODY_SIZE:
+        return json_response(ERR_BODY_TOO_LARGE, status=413)
     try:
-        payload = await request.json()
-    except json.JSONDecodeError:
-        return web.json_response({"message": "Invalid JSON payload."}, status=400)
+        payload = orjson.loads(await request.read())
+    except orjson.JSONDecodeError:
+        return json_response(ERR_INVALID_JSON, status=400)
+    if not isinstance(payload, dict):
+        return json_response(ERR_INVALID_JSON, status=400)
 
     watch_id = str(payload.get("watch_id", "")).strip()
     if not watch_id:
-        return web.json_response({"message": "Watch ID is required."}, status=400)
+        return json_response(ERR_WATCH_ID_REQUIRED, status=400)
+    if len(watch_id) > MAX_WATCH_ID_LENGTH:
+        return json_response(ERR_WATCH_ID_TOO_LONG, status=400)
+    preferred_language = payload.get("preferred_language") or None
+    if preferred_language is not None and (
+        not isinstance(preferred_language, str) or not LANGUAGE_CODE_RE.match(preferred_language)
+    ):
+        return json_response(ERR_INVALID_LANGUAGE, status=400)
 
     reservation_id = uuid.uuid4().hex
+    job = JobState(watch_id=watch_id)
     jobs: dict[str, JobState] = request.app["jobs"]
-    jobs[reservation_id] = JobState(watch_id=watch_id)
-    asyncio.create_task(process_download_job(request.app, reservation_id))
+    jobs[reservation_id] = job
+
+    url = build_watch_url(watch_id)
+    inflight: dict[tuple[str, Optional[str]], dict[str, JobState]] = request.app["inflight"]
+    subscribers = inflight.get((url, preferred_language))
+    if subscribers is not None:
+        subscribers[reservation_id] = job
+        job.publish({"event": "log", "data": {"message": "Joined an in-progress download for this video."}})
+    else:
+        inflight[(url, preferred_language)] = {reservation_id: job}
+        asyncio.create_task(process_download_job(request.app, url, preferred_language))
+
+    return json_response({"reservation_id": reservation_id})
+
 
-    return web.json_response({"reservation_id": reservation_id})
+def encode_sse_event(event: dict[str, Any]) -> bytes:
+    data = orjson.dumps(event["data"])
+    return b"event: " + event["event"].encode("utf-8") + b"\ndata: " + data + b"\n\n"
 
 
 async def events_handler(request: web.Request) -> web.StreamResponse:
@@ -276,13 +911,21 @@ async def events_handler(request: web.Request) -> web.StreamResponse:
     )
     await response.prepare(request)
 
+    loop = asyncio.get_running_loop()
     while True:
         if job.done.is_set() and job.events.empty():
             break
-        event = await job.events.get()
-        event_type = event["event"]
-        data = json.dumps(event["data"], ensure_ascii=False)
-        await response.write(f"event: {event_type}\ndata: {data}\n\n".encode("utf-8"))
+        batch = [await job.events.get()]
+        deadline = loop.time() + SSE_BATCH_WINDOW
+        while len(batch) < SSE_BATCH_SIZE and batch[-1]["event"] == "log":
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(job.events.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        await response.write(b"".join(encode_sse_event(event) for event in batch))
 
     await response.write_eof()
     return response
@@ -296,23 +939,38 @@ async def result_handler(request: web.Request) -> web.Response:
         raise web.HTTPNotFound(text="reservation not found")
 
     if not job.done.is_set():
-        return web.json_response({"status": "processing"}, status=202)
+        return json_response(PROCESSING_STATUS, status=202)
     if job.error:
-        return web.json_response({"type": "error", "message": job.error}, status=500)
+        jobs.pop(reservation_id, None)
+        return json_response({"type": "error", "message": job.error}, status=500)
     if job.result is None:
-        return web.json_response({"type": "error", "message": "Result not available."}, status=500)
-    return web.json_response(job.result)
+        return json_response(ERR_RESULT_NOT_AVAILABLE, status=500)
+    return json_response(job.result)
 
 
-def frontend_file_response(frontend_dir: Path, file_path: Path) -> web.FileResponse:
-    resolved = file_path.resolve()
-    try:
-        resolved.relative_to(frontend_dir.resolve())
-    except ValueError as exc:
-        raise web.HTTPNotFound() from exc
-    if not resolved.exists() or not resolved.is_file():
-        raise web.HTTPNotFound()
-    return web.FileResponse(resolved)
+async def text_handler(request: web.Request) -> web.StreamResponse:
+    reservation_id = request.match_info.get("reservation_id", "")
+    jobs: dict[str, JobState] = request.app["jobs"]
+    job = jobs.get(reservation_id)
+    if job is None:
+        raise web.HTTPNotFound(text="reservation not found")
+
+    if not job.done.is_set():
+        return json_response(PROCESSING_STATUS, status=202)
+    if job.text is None:
+        return json_response(ERR_TEXT_NOT_AVAILABLE, status=500)
+
+    response = web.StreamResponse(
+        status=200,
+        headers={"Content-Type": "text/plain; charset=utf-8"},
+    )
+    await response.prepare(request)
+    text = job.text
+    for start in range(0, len(text), TEXT_CHUNK_SIZE):
+        await response.write(text[start : start + TEXT_CHUNK_SIZE].encode("utf-8"))
+    await response.write_eof()
+    jobs.pop(reservation_id, None)
+    return response
 
 
 @web.middleware
@@ -331,35 +989,135 @@ async def cors_middleware(
 
 
 
+async def reap_jobs(app: web.Application) -> None:
+    jobs: dict[str, JobState] = app["jobs"]
+    ttl: float = app["jobs_ttl"]
+    while True:
+        await asyncio.sleep(max(ttl / 4, JOB_REAP_MIN_INTERVAL))
+        cutoff = time.monotonic() - ttl
+        expired = [
+            reservation_id
+            for reservation_id, job in jobs.items()
+            if job.completed_at is not None and job.completed_at < cutoff
+        ]
+        for reservation_id in expired:
+            del jobs[reservation_id]
+
+
+async def start_job_reaper(app: web.Application) -> None:
+    app["job_reaper"] = asyncio.create_task(reap_jobs(app))
+
+
+async def stop_job_reaper(app: web.Application) -> None:
+    app["job_reaper"].cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await app["job_reaper"]
+
+
+async def create_tmp_root(app: web.Application) -> None:
+    app["tmp_root"] = tempfile.TemporaryDirectory(prefix="yt_subtitle_")
+
+
+async def cleanup_tmp_root(app: web.Application) -> None:
+    app["tmp_root"].cleanup()
+
+
+async def start_ytdlp_pool(app: web.Application) -> None:
+    executor: Executor = app["ytdlp_pool"]
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(loop.run_in_executor(executor, warm_up_worker) for _ in range(app["ytdlp_workers"]))
+    )
+
+
+async def stop_ytdlp_pool(app: web.Application) -> None:
+    executor: Executor = app["ytdlp_pool"]
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
 def create_app(
     *,
     serve_frontend: bool = True,
     frontend_dir: Path = FRONTEND_DIR,
     keep_temp: bool = False,
     cookies_path: Optional[Path] = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    meta_cache_entries: int = DEFAULT_META_CACHE_ENTRIES,
+    text_cache_entries: int = DEFAULT_TEXT_CACHE_ENTRIES,
+    ytdlp_workers: int = 0,
+    ytdlp_executor: str = "process",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    jobs_ttl: float = DEFAULT_JOBS_TTL,
+    cache_dir: Optional[Path] = None,
+    disk_cache_entries: int = DEFAULT_DISK_CACHE_ENTRIES,
 ) -> web.Application:
-    app = web.Application(middlewares=[cors_middleware])
+    app = web.Application(middlewares=[cors_middleware], client_max_size=MAX_REQUEST_BODY_SIZE)
     app["keep_temp"] = keep_temp
     app["cookies_path"] = cookies_path
+    app["meta_cache"] = TTLCache(ttl=cache_ttl, max_entries=meta_cache_entries)
+    app["text_cache"] = TTLCache(ttl=cache_ttl, max_entries=text_cache_entries)
+    app["disk_cache"] = None
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        app["disk_cache"] = DiskCache(
+            directory=cache_dir, ttl=cache_ttl, max_entries=disk_cache_entries
+        )
     app["jobs"] = {}
+    app["jobs_ttl"] = jobs_ttl
+    app["inflight"] = {}
+    app.on_startup.append(start_job_reaper)
+    app.on_cleanup.append(stop_job_reaper)
+    app.on_startup.append(create_tmp_root)
+    app.on_cleanup.append(cleanup_tmp_root)
+    app["max_concurrency"] = max_concurrency
+    app["job_sem"] = asyncio.Semaphore(max_concurrency)
+    app["ytdlp_workers"] = ytdlp_workers
+    app["ytdlp_pool"] = None
+    if ytdlp_workers > 0 and ytdlp_executor == "thread":
+        app["ytdlp_pool"] = ThreadPoolExecutor(
+            max_workers=ytdlp_workers, thread_name_prefix="yt-dlp"
+        )
+    elif ytdlp_workers > 0:
+        app["ytdlp_pool"] = ProcessPoolExecutor(
+            max_workers=ytdlp_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    if ytdlp_workers > 0:
+        app.on_startup.append(start_ytdlp_pool)
+        app.on_cleanup.append(stop_ytdlp_pool)
 
     app.router.add_post("/reservation", reservation_handler)
     app.router.add_get("/events/{reservation_id}", events_handler)
     app.router.add_get("/result/{reservation_id}", result_handler)
+    app.router.add_get("/text/{reservation_id}", text_handler, allow_head=False)
 
     if serve_frontend:
         app["frontend_dir"] = frontend_dir
 
-        async def frontend_handler(request: web.Request) -> web.FileResponse:
-            raw_path = request.match_info.get("path", "")
-            target = raw_path or "index.html"
-            return frontend_file_response(frontend_dir, frontend_dir / target)
+        index_path = frontend_dir / "index.html"
+
+        async def index_handler(request: web.Request) -> web.FileResponse:
+            return web.FileResponse(index_path)
 
-        app.router.add_get("/", frontend_handler)
-        app.router.add_get("/{path:.*}", frontend_handler)
+        app.router.add_get("/", index_handler)
+        app.router.add_static("/", frontend_dir, show_index=False, follow_symlinks=False)
     return app
 
 
+def positive_float(value: str) -> float:
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="YT Subtitle Downloader backend")
     parser.add_argument(
@@ -391,17 +1149,90 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Path to a cookies.txt file to pass to yt-dlp",
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help="Seconds to cache video metadata and subtitle text; 0 disables (default: 86400)",
+    )
+    parser.add_argument(
+        "--meta-cache-entries",
+        type=positive_int,
+        default=DEFAULT_META_CACHE_ENTRIES,
+        help="Maximum number of videos whose metadata is kept in memory (default: 32)",
+    )
+    parser.add_argument(
+        "--text-cache-entries",
+        type=positive_int,
+        default=DEFAULT_TEXT_CACHE_ENTRIES,
+        help="Maximum number of subtitle texts kept in memory (default: 256)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory to persist subtitle text per video across restarts (default: memory only)",
+    )
+    parser.add_argument(
+        "--disk-cache-entries",
+        type=positive_int,
+        default=DEFAULT_DISK_CACHE_ENTRIES,
+        help="Maximum number of videos kept in --cache-dir; the oldest are removed (default: 1024)",
+    )
+    parser.add_argument(
+        "--ytdlp-workers",
+        type=int,
+        default=0,
+        help="Run yt-dlp in N persistent worker processes via its Python API "
+        "instead of spawning the CLI per request (default: 0, use the CLI)",
+    )
+    parser.add_argument(
+        "--ytdlp-executor",
+        choices=("process", "thread"),
+        default="process",
+        help="Run --ytdlp-workers as separate processes or as threads inside the server "
+        "(default: process)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=positive_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum number of downloads processed at once; others wait in line "
+        "(default: min(4, CPU count))",
+    )
+    parser.add_argument(
+        "--jobs-ttl",
+        type=positive_float,
+        default=DEFAULT_JOBS_TTL,
+        help="Seconds to keep finished jobs whose result was never fetched (default: 300)",
+    )
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = parse_args()
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        loop = uvloop.new_event_loop()
     web.run_app(
         create_app(
             serve_frontend=args.serve_frontend,
             frontend_dir=args.frontend_dir,
             keep_temp=args.keep_temp,
             cookies_path=args.cookies,
+            cache_ttl=args.cache_ttl,
+            meta_cache_entries=args.meta_cache_entries,
+            text_cache_entries=args.text_cache_entries,
+            ytdlp_workers=args.ytdlp_workers,
+            ytdlp_executor=args.ytdlp_executor,
+            max_concurrency=args.max_concurrency,
+            jobs_ttl=args.jobs_ttl,
+            cache_dir=args.cache_dir,
+            disk_cache_entries=args.disk_cache_entries,
         ),
         port=args.port,
+        loop=loop,
     )
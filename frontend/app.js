@@ -130,7 +130,19 @@ function waitForEvents(baseUrl, reservationId) {
         appendLog("Frontend: Received invalid log event payload.", "warn");
         return;
       }
-      appendLog(`Backend: ${data.message || ""}`);
+      const lines = data.lines || [data.message || ""];
+      lines.forEach((line) => appendLog(`Backend: ${line}`));
+    });
+
+    eventSource.addEventListener("queued", (event) => {
+      let data;
+      try {
+        data = JSON.parse(event.data);
+      } catch (error) {
+        data = {};
+      }
+      setStatus("Queued, waiting for a free download slot...");
+      appendLog(`Backend: ${data.message || "Queued."}`, "warn");
     });
 
     eventSource.addEventListener("error", (event) => {
@@ -172,6 +184,14 @@ async function fetchResult(baseUrl, reservationId) {
   return payload;
 }
 
+async function fetchText(baseUrl, reservationId) {
+  const response = await fetch(buildEndpointUrl(baseUrl, `text/${encodeURIComponent(reservationId)}`));
+  if (!response.ok) {
+    throw new Error("Failed to fetch subtitle text.");
+  }
+  return response.text();
+}
+
 function sanitizeWatchId(value) {
   const trimmed = value.trim();
   if (!trimmed) {
@@ -247,7 +267,8 @@ downloadButton.addEventListener("click", async () => {
     setStatus("Fetching final subtitle result...");
     const data = await fetchResult(baseUrl, reservationId);
 
-    latestText = data.text || "";
+    setStatus("Fetching full subtitle text...");
+    latestText = await fetchText(baseUrl, reservationId);
     fullText.value = latestText;
     copyButton.disabled = !latestText;
     if (copyPromptButton) {
@@ -0,0 +1,185 @@
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+import app  # noqa: E402
+
+SLOW_ID = "slowslowslo"
+FAKE_YT_DLP = f"""#!{sys.executable}
+import json, os, sys, time
+args = sys.argv[1:]
+with open(os.environ["FAKE_YT_DLP_LOG"], "a") as log:
+    log.write(" ".join(args) + "\\n")
+if any("{SLOW_ID}" in arg for arg in args):
+    time.sleep(1)
+if "--dump-single-json" in args:
+    info = {{"subtitles": {{"en": [{{"ext": "json3"}}]}}, "automatic_captions": {{"fr": []}}}}
+    print(json.dumps(info))
+    sys.exit(0)
+language = args[args.index("--sub-lang") + 1]
+path = args[args.index("-o") + 1].replace("%(ext)s", language + ".json3")
+with open(path, "w") as handle:
+    json.dump({{"events": [{{"segs": [{{"utf8": "hello " + language}}]}}]}}, handle)
+"""
+
+
+@pytest.fixture
+def yt_dlp_calls(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "yt-dlp"
+    script.write_text(FAKE_YT_DLP, encoding="utf-8")
+    script.chmod(0o755)
+    log_path = tmp_path / "calls.log"
+    log_path.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_YT_DLP_LOG", str(log_path))
+    return lambda: log_path.read_text(encoding="utf-8").splitlines()
+
+
+def run_with_client(scenario, **app_options):
+    async def run():
+        web_app = app.create_app(serve_frontend=False, **app_options)
+        client = TestClient(TestServer(web_app))
+        await client.start_server()
+        try:
+            return await scenario(client, web_app)
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+async def reserve(client, watch_id, **payload):
+    response = await client.post("/reservation", json={"watch_id": watch_id, **payload})
+    return (await response.json())["reservation_id"]
+
+
+async def run_job(client, watch_id, **payload):
+    reservation_id = await reserve(client, watch_id, **payload)
+    return await (await client.get(f"/events/{reservation_id}")).text()
+
+
+def test_cache_hit_does_not_wait_for_busy_slot(yt_dlp_calls):
+    async def scenario(client, web_app):
+        await run_job(client, "aaaaaaaaaaa")
+        slow = asyncio.create_task(run_job(client, SLOW_ID))
+        await asyncio.sleep(0.3)
+        events = await run_job(client, "aaaaaaaaaaa")
+        assert not slow.done()
+        await slow
+        return events
+
+    events = run_with_client(scenario, max_concurrency=1)
+
+    assert "event: completed" in events
+    assert "event: queued" not in events
+
+
+def test_identical_reservations_share_one_job(yt_dlp_calls):
+    async def scenario(client, web_app):
+        return await asyncio.gather(run_job(client, SLOW_ID), run_job(client, SLOW_ID))
+
+    first, second = run_with_client(scenario)
+
+    assert "event: completed" in first
+    assert "event: completed" in second
+    assert "Joined an in-progress download" in first + second
+    assert sum("--dump-single-json" in call for call in yt_dlp_calls()) == 1
+
+
+def test_speculative_download_is_used_for_available_language(yt_dlp_calls):
+    async def scenario(client, web_app):
+        reservation_id = await reserve(client, "aaaaaaaaaaa", preferred_language="en")
+        await (await client.get(f"/events/{reservation_id}")).text()
+        return await (await client.get(f"/text/{reservation_id}")).text()
+
+    assert run_with_client(scenario) == "hello en"
+    downloads = [call for call in yt_dlp_calls() if "--sub-lang" in call]
+    assert len(downloads) == 1
+    assert "--load-info-json" not in downloads[0]
+
+
+def test_speculative_download_is_discarded_for_missing_language(yt_dlp_calls):
+    async def scenario(client, web_app):
+        reservation_id = await reserve(client, "aaaaaaaaaaa", preferred_language="de")
+        await (await client.get(f"/events/{reservation_id}")).text()
+        return await (await client.get(f"/text/{reservation_id}")).text()
+
+    assert run_with_client(scenario) == "hello en"
+    downloads = [call for call in yt_dlp_calls() if "--sub-lang" in call]
+    assert any("--sub-lang de" in call for call in downloads)
+    assert any("--sub-lang en" in call for call in downloads)
+
+
+def test_reaper_removes_finished_jobs(yt_dlp_calls):
+    async def scenario(client, web_app):
+        await run_job(client, "aaaaaaaaaaa")
+        assert len(web_app["jobs"]) == 1
+        await asyncio.sleep(app.JOB_REAP_MIN_INTERVAL + 0.3)
+        return len(web_app["jobs"])
+
+    assert run_with_client(scenario, jobs_ttl=0.1) == 0
+
+
+def test_publish_keeps_terminal_event_when_queue_is_full():
+    job = app.JobState(watch_id="aaaaaaaaaaa")
+    for index in range(app.EVENT_QUEUE_SIZE * 2):
+        job.publish({"event": "log", "data": {"message": str(index)}})
+    job.publish({"event": "completed", "data": {}})
+
+    events = [job.events.get_nowait() for _ in range(job.events.qsize())]
+
+    assert len(events) == app.EVENT_QUEUE_SIZE
+    assert events[-1]["event"] == "completed"
+
+    job.publish({"event": "log", "data": {"message": "next"}})
+    skipped = job.events.get_nowait()["data"]["message"]
+
+    assert skipped.startswith(f"Skipped {app.EVENT_QUEUE_SIZE + 1} log lines")
+    assert job.events.get_nowait()["data"]["message"] == "next"
+
+
+def test_disk_cache_prune_removes_expired_and_oldest_entries(tmp_path):
+    cache = app.DiskCache(directory=tmp_path, ttl=60, max_entries=2)
+    now = time.time()
+    for name, age in [
+        ("expired.json", 120),
+        ("stale.json.tmp", 120),
+        ("other.txt", 120),
+        ("old.json", 30),
+        ("mid.json", 20),
+        ("new.json", 10),
+    ]:
+        path = tmp_path / name
+        path.write_bytes(b"{}")
+        os.utime(path, (now - age, now - age))
+
+    cache.prune()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["mid.json", "new.json", "other.txt"]
+
+
+def test_get_or_fetch_coalesces_without_ttl():
+    cache = app.TTLCache(ttl=0, max_entries=1)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"calls": calls}
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_fetch("key", fetch) for _ in range(3)))
+
+    assert asyncio.run(run()) == [{"calls": 1}] * 3
+    assert calls == 1
+    assert not cache.pending
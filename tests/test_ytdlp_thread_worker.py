@@ -0,0 +1,66 @@
+import asyncio
+import functools
+import http.server
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("yt_dlp")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+import app  # noqa: E402
+
+
+@pytest.fixture
+def subtitle_url(tmp_path):
+    payload = {"events": [{"segs": [{"utf8": "hello"}]}, {"segs": [{"utf8": "world"}]}]}
+    (tmp_path / "sub.json3").write_text(json.dumps(payload), encoding="utf-8")
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=str(tmp_path)
+    )
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/sub.json3"
+    finally:
+        server.shutdown()
+
+
+def test_thread_worker_downloads_subtitles_with_logger(tmp_path, subtitle_url):
+    info = {
+        "id": "abcdefghijk",
+        "title": "test",
+        "extractor": "generic",
+        "extractor_key": "Generic",
+        "webpage_url": subtitle_url,
+        "formats": [{"format_id": "0", "url": subtitle_url, "ext": "mp4"}],
+        "subtitles": {"en": [{"ext": "json3", "url": subtitle_url}]},
+        "automatic_captions": {},
+    }
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    lines: list[str] = []
+
+    async def run() -> Path:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await app.run_yt_dlp_subtitles(
+                subtitle_url,
+                "en",
+                False,
+                out_dir,
+                None,
+                info=info,
+                executor=executor,
+                on_log=lines.extend,
+            )
+
+    path = asyncio.run(run())
+
+    assert app.parse_subtitle_text(path, "en") == "hello world"
+    assert any("Writing video subtitles" in line for line in lines)